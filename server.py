@@ -1,14 +1,35 @@
 from __future__ import annotations
 
+import atexit
+import bisect
 import json
+import locale
 import os
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta, time
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
+from datetime import date, datetime, timedelta, time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Literal
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Literal
+from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel, Field
 
+# Optional faster JSON codec; falls back to the stdlib json module.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Optional C parser for journal timestamps; falls back to the stdlib.
+try:
+    from ciso8601 import parse_datetime as _iso_parse
+except ImportError:  # pragma: no cover
+    _iso_parse = datetime.fromisoformat
+
 # Server
 try:
     from fastmcp import FastMCP
@@ -20,18 +41,25 @@ except Exception as e:  # pragma: no cover
 
 DATA_DIR = Path(os.getenv("HEALTH_GUARD_DATA_DIR") or "data")
 FALLBACK_DIR = Path(os.getenv("HEALTH_GUARD_FALLBACK_DIR") or (Path.home() / ".health-guard-mcp"))
-JOURNAL_PATH = DATA_DIR / "journal.json"
+JOURNAL_PATH = DATA_DIR / "journal.jsonl"
+LEGACY_JOURNAL_PATH = DATA_DIR / "journal.json"  # pre-JSONL format, migrated on first load
 CONFIG_PATH = DATA_DIR / "config.json"
+PRETTY_JSON = os.getenv("HEALTH_GUARD_PRETTY") == "1"  # indent config.json for human inspection
 
 
-def _now(tz_name: Optional[str]) -> datetime:
+@lru_cache(maxsize=16)
+def _zoneinfo(tz_name: str) -> Optional[ZoneInfo]:
     try:
-        if tz_name:
-            from zoneinfo import ZoneInfo  # Python 3.9+
-
-            return datetime.now(ZoneInfo(tz_name))
+        return ZoneInfo(tz_name)
     except Exception:
-        pass
+        return None
+
+
+def _now(tz_name: Optional[str]) -> datetime:
+    # The cache needs a hashable key; any other value from config.json falls back like an invalid name.
+    tz = _zoneinfo(tz_name) if tz_name and isinstance(tz_name, str) else None
+    if tz is not None:
+        return datetime.now(tz)
     # Fallback to local timezone
     return datetime.now().astimezone()
 
@@ -40,18 +68,8 @@ def _iso(dt: datetime) -> str:
     return dt.isoformat()
 
 
-def _parse(dt: str) -> datetime:
-    # Accept both with and without timezone; assume local tz if naive
-    try:
-        parsed = datetime.fromisoformat(dt)
-        if parsed.tzinfo is None:
-            return parsed.astimezone()
-        return parsed
-    except Exception:
-        return _now(None)
-
-
 def _parse_iso_or_none(dt: Optional[str]) -> Optional[datetime]:
+    # User-supplied timestamps: accept both with and without timezone; assume local tz if naive.
     if not dt:
         return None
     try:
@@ -63,6 +81,13 @@ def _parse_iso_or_none(dt: Optional[str]) -> Optional[datetime]:
         return None
 
 
+@lru_cache(maxsize=8192)
+def _parse_trusted(dt: str) -> datetime:
+    # For journal timestamps read from disk; the caller handles ValueError and naive results.
+    # Memoized so re-reading a journal changed by another process only parses new lines.
+    return _iso_parse(dt)
+
+
 # Note: We intentionally do not parse natural-language relative times server-side.
 # The client assistant should resolve phrases like "2 hours ago" into exact ISO timestamps
 # in the *_when fields using the user's timezone context, before calling this tool.
@@ -78,23 +103,105 @@ def _primary_or_fallback(path: Path) -> Path:
     return path
 
 
-def _load_json(path: Path, default: Any) -> Any:
-    p = _primary_or_fallback(path)
-    if not p.exists():
+# Parsed JSON documents keyed by the file they were read from, together with the
+# (mtime_ns, size) stamp of that file. Callers share the cached objects and must
+# not mutate them in place.
+_JSON_CACHE: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _stamp(p: Path) -> Tuple[int, int]:
+    st = p.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+# Files are read and written as UTF-8 bytes, so orjson never round-trips through str.
+def _loads_json(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_json(data: Any) -> bytes:
+    # Files are machine-read; compact separators keep writes and reparses small.
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _dumps_json_file(data: Any) -> bytes:
+    # Whole-file documents may be indented on request; JSONL lines always stay one per line.
+    if not PRETTY_JSON:
+        return _dumps_json(data)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode()
+
+
+def _loads_jsonl(raw: bytes) -> List[Dict[str, Any]]:
+    entries: List[Dict[str, Any]] = []
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entries.append(_loads_json(line))
+        except ValueError:
+            # Tolerate a torn line left by an interrupted append.
+            continue
+    return entries
+
+
+def _dumps_jsonl_line(record: Dict[str, Any]) -> bytes:
+    # Keys starting with "_" are in-memory only (e.g. a journal entry's parsed "_ts").
+    return _dumps_json({k: v for k, v in record.items() if not k.startswith("_")}) + b"\n"
+
+
+def _dumps_jsonl(entries: List[Dict[str, Any]]) -> bytes:
+    return b"".join(_dumps_jsonl_line(e) for e in entries)
+
+
+def _load_json(path: Path, default: Any, loads: Callable[[bytes], Any] = _loads_json) -> Any:
+    # Same lookup order as _primary_or_fallback, but one stat per candidate serves as both
+    # the existence check and the cache stamp.
+    for p in (path, FALLBACK_DIR / path.name):
+        try:
+            stamp = _stamp(p)
+            break
+        except OSError:
+            continue
+    else:
         return default
+    cached = _JSON_CACHE.get(p)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
     try:
-        return json.loads(p.read_text())
+        data = loads(p.read_bytes())
     except Exception:
         return default
+    _JSON_CACHE[p] = (stamp, data)
+    return data
+
+
+def _write_json(target: Path, data: Any, dumps: Callable[[Any], bytes]) -> None:
+    # Whole-file rewrites (config.json, the one-shot journal migration) are rare, so make them
+    # durable: fsync the temp file before the atomic rename. Journal appends skip all of this.
+    tmp = target.with_suffix(target.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(dumps(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, target)
+    # Keep the cache in step with what we just wrote so the next read is free.
+    try:
+        _JSON_CACHE[target] = (_stamp(target), data)
+    except OSError:
+        _JSON_CACHE.pop(target, None)
 
 
-def _save_json(path: Path, data: Any) -> None:
+def _save_json(path: Path, data: Any, dumps: Callable[[Any], bytes] = _dumps_json_file) -> None:
     # Try preferred location first, without creating parent chains that may be read-only.
     try:
         path.parent.mkdir(exist_ok=True)
-        tmp = path.with_suffix(path.suffix + ".tmp")
-        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2))
-        tmp.replace(path)
+        _write_json(path, data, dumps)
         return
     except Exception:
         pass
@@ -102,17 +209,76 @@ def _save_json(path: Path, data: Any) -> None:
     # Fallback to user-writable dir
     try:
         FALLBACK_DIR.mkdir(parents=True, exist_ok=True)
-        fb_path = FALLBACK_DIR / path.name
-        tmp = fb_path.with_suffix(fb_path.suffix + ".tmp")
-        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2))
-        tmp.replace(fb_path)
+        _write_json(FALLBACK_DIR / path.name, data, dumps)
         return
     except Exception:
         # As a last resort, attempt writing to current directory
-        cd_path = Path(".") / path.name
-        tmp = cd_path.with_suffix(cd_path.suffix + ".tmp")
-        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2))
-        tmp.replace(cd_path)
+        _write_json(Path(".") / path.name, data, dumps)
+
+
+def _append_line(target: Path, line: bytes, extend: Callable[[Any], Any]) -> None:
+    try:
+        before: Optional[Tuple[int, int]] = _stamp(target)
+    except OSError:
+        before = None
+    # Binary append mode (O_APPEND): a single write of one line, independent of journal size.
+    with target.open("ab+") as f:
+        if before is not None and before[1]:
+            # Start on a fresh line after a torn one (interrupted or partial write), so the
+            # fragment alone is skipped on read instead of swallowing this line too.
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                line = b"\n" + line
+        f.write(line)
+    # Extend the cached value only if it matched the file we just appended to.
+    cached = _JSON_CACHE.get(target)
+    if before is None:
+        data = extend(None)
+    elif cached is not None and cached[0] == before:
+        data = extend(cached[1])
+    else:
+        _JSON_CACHE.pop(target, None)
+        return
+    try:
+        _JSON_CACHE[target] = (_stamp(target), data)
+    except OSError:
+        _JSON_CACHE.pop(target, None)
+
+
+def _append_jsonl(path: Path, records: List[Dict[str, Any]], extend: Callable[[Any], Any]) -> None:
+    # extend(cached) returns the cached value with records added; cached is None for a new file.
+    # All records go out in one write.
+    line = _dumps_jsonl(records)
+    # Keep appending to whichever file already holds the log.
+    existing = _primary_or_fallback(path)
+    if existing.exists():
+        try:
+            _append_line(existing, line, extend)
+            return
+        except Exception:
+            pass
+
+    # Otherwise start a new log, preferring the same locations as _save_json.
+    try:
+        path.parent.mkdir(exist_ok=True)
+        _append_line(path, line, extend)
+        return
+    except Exception:
+        pass
+    try:
+        FALLBACK_DIR.mkdir(parents=True, exist_ok=True)
+        _append_line(FALLBACK_DIR / path.name, line, extend)
+        return
+    except Exception:
+        _append_line(Path(".") / path.name, line, extend)
+
+
+# "HH:MM" preference fields and the attribute holding their parsed time of day.
+_HHMM_FIELDS = {
+    "ideal_sleep_start": "_ideal_sleep_time",
+    "quiet_hours_start": "_quiet_start_time",
+    "quiet_hours_end": "_quiet_end_time",
+}
 
 
 @dataclass
@@ -129,22 +295,38 @@ class Preferences:
     sleep_escalate_max_hours: int = 3
     # Nudges are intentionally firm to emphasize longevity; no tone setting
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # Parse HH:MM once on assignment rather than on every nudge/quiet-hours check.
+        derived = _HHMM_FIELDS.get(name)
+        if derived is not None:
+            object.__setattr__(self, derived, _hhmm_to_time(value))
+        # Any field change invalidates the cached to_dict() result.
+        object.__setattr__(self, "_dict_cache", None)
+
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Shared between save() and the response payloads; treat as read-only.
+        cached = self._dict_cache
+        if cached is None:
+            cached = asdict(self)
+            object.__setattr__(self, "_dict_cache", cached)
+        return cached
 
     @staticmethod
     def load() -> "Preferences":
         raw = _load_json(CONFIG_PATH, {})
         prefs = Preferences()
-        for k, v in raw.items():
-            if hasattr(prefs, k):
-                setattr(prefs, k, v)
+        for k in raw.keys() & _PREFERENCE_FIELDS:
+            setattr(prefs, k, raw[k])
         return prefs
 
     def save(self) -> None:
         _save_json(CONFIG_PATH, self.to_dict())
 
 
+_PREFERENCE_FIELDS = frozenset(Preferences.__dataclass_fields__)
+
+
 def _hhmm_to_time(hhmm: str) -> time:
     try:
         h, m = hhmm.split(":", 1)
@@ -154,8 +336,8 @@ def _hhmm_to_time(hhmm: str) -> time:
 
 
 def _in_quiet_hours(now: datetime, prefs: Preferences) -> bool:
-    start = _hhmm_to_time(prefs.quiet_hours_start)
-    end = _hhmm_to_time(prefs.quiet_hours_end)
+    start = prefs._quiet_start_time
+    end = prefs._quiet_end_time
     # Use naive HH:MM to avoid tz-aware time comparisons
     t = time(now.hour, now.minute)
     # Quiet hours can span midnight
@@ -170,113 +352,363 @@ def _today_bounds(now: datetime) -> Tuple[datetime, datetime]:
     return start, end
 
 
-def _load_journal() -> List[Dict[str, Any]]:
-    return _load_json(JOURNAL_PATH, [])
+_LEGACY_JOURNAL_CHECKED = False
 
 
-def _save_journal(entries: List[Dict[str, Any]]) -> None:
-    _save_json(JOURNAL_PATH, entries)
+def _read_legacy_journal() -> bytes:
+    # journal.json re-encoded as JSONL. Unlike _load_json this raises instead of returning a
+    # default, so an unreadable file is never mistaken for an empty history.
+    raw = _primary_or_fallback(LEGACY_JOURNAL_PATH).read_bytes()
+    # Older versions wrote it with Path.write_text, i.e. in the locale encoding (cp1252 on Windows).
+    for encoding in ("utf-8-sig", locale.getpreferredencoding(False)):
+        try:
+            entries = json.loads(raw.decode(encoding))
+        except (LookupError, ValueError):
+            continue
+        if isinstance(entries, list):
+            return b"".join(_dumps_json(e) + b"\n" for e in entries)
+    raise ValueError(f"{LEGACY_JOURNAL_PATH.name} is not a readable JSON array")
 
 
-def _add_entry(kind: str, note: str, prefs: Preferences, when: Optional[str] = None) -> Dict[str, Any]:
-    now = _now(prefs.timezone)
-    ts = _parse(when) if when else now
-    entry = {"ts": _iso(ts), "kind": kind, "note": note or ""}
-    entries = _load_journal()
-    entries.append(entry)
-    _save_journal(entries)
-    return entry
-
-
-def _last_of(kind: str, now: datetime) -> Optional[datetime]:
-    entries = _load_journal()
-    latest: Optional[datetime] = None
-    for e in entries[::-1]:  # search from end for speed
-        if e.get("kind") == kind:
-            ts = _parse(e.get("ts", ""))
-            if ts <= now:
-                latest = ts
-                break
-    return latest
-
-
-def _count_today(kinds: List[str], now: datetime) -> int:
-    start, end = _today_bounds(now)
-    entries = _load_journal()
-    return sum(1 for e in entries if e.get("kind") in kinds and start <= _parse(e.get("ts", "")) < end)
-
-
-def _days_streak(predicate) -> int:
-    entries = _load_journal()
-    # Organize by date string
-    by_day: Dict[str, List[Dict[str, Any]]] = {}
-    for e in entries:
-        d = _parse(e.get("ts", "")).date().isoformat()
-        by_day.setdefault(d, []).append(e)
-
-    today = datetime.now().astimezone().date()
-    streak = 0
-    d = today
+def _migrate_legacy_journal() -> None:
+    # One-shot conversion of the old single-array journal.json into journal.jsonl.
+    if _primary_or_fallback(JOURNAL_PATH).exists():
+        return
+    if not _primary_or_fallback(LEGACY_JOURNAL_PATH).exists():
+        return
+    _save_journal(_read_legacy_journal())
+
+
+# Journal appends run on a background writer so tool calls do not wait on disk. Entries
+# stay in _JOURNAL_PENDING until written, and _load_journal serves them from there. A failed
+# write keeps them pending for the next attempt and is reported by the next preflight call.
+_JOURNAL_LOCK = threading.Lock()
+_JOURNAL_QUEUE: "queue.SimpleQueue[bool]" = queue.SimpleQueue()  # True: write pending; False: stop
+_JOURNAL_PENDING: List[Dict[str, Any]] = []
+_JOURNAL_WRITE_ERRORS: List[str] = []
+_JOURNAL_WRITER: Optional[threading.Thread] = None
+
+
+def _write_pending_journal() -> None:
+    # Caller holds _JOURNAL_LOCK. Writes everything pending, in order, including entries whose
+    # earlier write failed; entries leave _JOURNAL_PENDING only once they are on disk.
+    if not _JOURNAL_PENDING:
+        return
+    batch = list(_JOURNAL_PENDING)
+    try:
+        _append_jsonl(JOURNAL_PATH, batch, lambda journal: _journal_with(journal, batch))
+    except Exception as e:
+        print(f"health-guard-mcp: failed to write {len(batch)} journal entries, will retry: {e}", file=sys.stderr)
+        _JOURNAL_WRITE_ERRORS.append(str(e))
+        return
+    del _JOURNAL_PENDING[:len(batch)]
+
+
+def _journal_writer() -> None:
     while True:
-        key = d.isoformat()
-        if key not in by_day or not predicate(by_day[key]):
-            break
-        streak += 1
-        d = d - timedelta(days=1)
-    return streak
+        keep_running = _JOURNAL_QUEUE.get()
+        with _JOURNAL_LOCK:
+            _write_pending_journal()
+        if not keep_running:
+            return
+
+
+def _enqueue_journal_write(batch: List[Dict[str, Any]]) -> None:
+    global _JOURNAL_WRITER
+    with _JOURNAL_LOCK:
+        _JOURNAL_PENDING.extend(batch)
+        if _JOURNAL_WRITER is None or not _JOURNAL_WRITER.is_alive():
+            _JOURNAL_WRITER = threading.Thread(target=_journal_writer, name="health-guard-journal", daemon=True)
+            _JOURNAL_WRITER.start()
+        _JOURNAL_QUEUE.put(True)
+
 
+def _take_journal_write_errors() -> List[str]:
+    # Distinct write failures since the last call, oldest first.
+    with _JOURNAL_LOCK:
+        errors = list(dict.fromkeys(_JOURNAL_WRITE_ERRORS))
+        _JOURNAL_WRITE_ERRORS.clear()
+    return errors
 
-def _meals_pred(day_entries: List[Dict[str, Any]]) -> bool:
-    return any(e.get("kind") == "meal" for e in day_entries)
 
+def _flush_journal_writes() -> None:
+    # Drain queued appends and stop the writer; a later append starts a new one.
+    writer = _JOURNAL_WRITER
+    if writer is not None and writer.is_alive():
+        _JOURNAL_QUEUE.put(False)
+        writer.join()
 
-def _move_pred(day_entries: List[Dict[str, Any]]) -> bool:
-    return any(e.get("kind") == "move" for e in day_entries)
+
+atexit.register(_flush_journal_writes)
+
+
+def _journal_entry_or_none(raw: Any) -> Optional[Dict[str, Any]]:
+    # Validate once at load and attach the parsed, tz-aware timestamp as "_ts" (and its POSIX
+    # time as "_epoch", for cheap float range checks) so the scan helpers never touch the ISO
+    # string. Both live only in memory; see _dumps_jsonl_line.
+    if not isinstance(raw, dict) or not isinstance(raw.get("kind"), str) or not isinstance(raw.get("ts"), str):
+        return None
+    try:
+        ts = _parse_trusted(raw["ts"])
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        # Assume local tz for naive timestamps, as _parse_iso_or_none does for user input.
+        ts = ts.astimezone()
+        raw = {**raw, "ts": _iso(ts)}
+    raw["_ts"] = ts
+    raw["_epoch"] = ts.timestamp()
+    # Decoded kinds are fresh strings per line; intern them so kind comparisons in the
+    # scans hit the identity fast path and the journal holds one copy of each.
+    raw["kind"] = sys.intern(raw["kind"])
+    return raw
+
+
+@dataclass
+class _JournalIndex:
+    # Validated entries plus lookups maintained alongside them. Instances are shared through the
+    # cache and by concurrent requests, so they are never modified after construction.
+    entries: List[Dict[str, Any]] = field(default_factory=list)
+    last_by_kind: Dict[str, datetime] = field(default_factory=dict)  # most recently logged ts per kind
+    by_day: Dict[date, List[Dict[str, Any]]] = field(default_factory=dict)  # entries by their own local date
+    epochs_by_kind: Dict[str, List[float]] = field(default_factory=dict)  # sorted "_epoch" values per kind
+
+
+def _journal_with(journal: Optional[_JournalIndex], new: List[Dict[str, Any]]) -> _JournalIndex:
+    # Copy-on-write: only the touched day buckets are copied, the rest are shared.
+    if journal is None:
+        journal = _JournalIndex()
+    entries = journal.entries + new
+    last_by_kind = dict(journal.last_by_kind)
+    by_day = dict(journal.by_day)
+    epochs_by_kind = dict(journal.epochs_by_kind)
+    touched: Set[date] = set()
+    touched_kinds: Set[str] = set()
+    for e in new:
+        ts = e["_ts"]
+        kind = e["kind"]
+        last_by_kind[kind] = ts
+        d = ts.date()
+        if d not in touched:
+            by_day[d] = list(by_day.get(d, ()))
+            touched.add(d)
+        by_day[d].append(e)
+        if kind not in touched_kinds:
+            epochs_by_kind[kind] = list(epochs_by_kind.get(kind, ()))
+            touched_kinds.add(kind)
+        epochs_by_kind[kind].append(e["_epoch"])
+    # Entries arrive mostly in time order (backdated reports are the exception), so this
+    # sort is close to linear.
+    for kind in touched_kinds:
+        epochs_by_kind[kind].sort()
+    return _JournalIndex(entries=entries, last_by_kind=last_by_kind, by_day=by_day, epochs_by_kind=epochs_by_kind)
+
+
+_EMPTY_JOURNAL = _JournalIndex()
+
+
+def _loads_journal(raw_bytes: bytes) -> _JournalIndex:
+    entries = []
+    for raw in _loads_jsonl(raw_bytes):
+        entry = _journal_entry_or_none(raw)
+        if entry is not None:
+            entries.append(entry)
+    return _journal_with(None, entries)
+
+
+def _ensure_journal_migrated() -> None:
+    # Caller holds _JOURNAL_LOCK, which also blocks the writer, so no append lands on
+    # journal.jsonl mid-migration. The flag is set only once the migration succeeds; on failure
+    # this raises and the next call retries.
+    global _LEGACY_JOURNAL_CHECKED
+    if not _LEGACY_JOURNAL_CHECKED:
+        _migrate_legacy_journal()
+        _LEGACY_JOURNAL_CHECKED = True
+
+
+def _load_journal() -> _JournalIndex:
+    with _JOURNAL_LOCK:
+        try:
+            _ensure_journal_migrated()
+        except Exception as e:
+            print(f"health-guard-mcp: journal migration failed, will retry: {e}", file=sys.stderr)
+        if _LEGACY_JOURNAL_CHECKED:
+            journal = _load_json(JOURNAL_PATH, _EMPTY_JOURNAL, _loads_journal)
+        else:
+            # Reads must not fail on unwritable storage: serve journal.json as-is meanwhile.
+            try:
+                journal = _loads_journal(_read_legacy_journal())
+            except (OSError, ValueError):
+                journal = _EMPTY_JOURNAL
+        if _JOURNAL_PENDING:
+            journal = _journal_with(journal, _JOURNAL_PENDING)
+    return journal
+
+
+_JOURNAL_PREFETCHED = False
+
+
+def _load_prefs_prefetching_journal() -> Preferences:
+    # On the first call neither file is cached yet, so read the journal on a worker thread
+    # while config.json loads. Later calls are cache hits where a thread would only add cost.
+    global _JOURNAL_PREFETCHED
+    if _JOURNAL_PREFETCHED:
+        return Preferences.load()
+    _JOURNAL_PREFETCHED = True
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        journal = ex.submit(_load_journal)
+        prefs = Preferences.load()
+        journal.result()
+    return prefs
+
+
+def _save_journal(raw: bytes) -> None:
+    # Entries are copied through unchanged, malformed ones included, so _loads_journal filters them
+    # on read as it does for appended lines. The cache is seeded with exactly what a reread yields.
+    _save_json(JOURNAL_PATH, _loads_journal(raw), lambda _journal: raw)
+
+
+def _build_entry(kind: str, note: str, prefs: Preferences, when: Optional[datetime] = None) -> Dict[str, Any]:
+    # when is the already-validated user timestamp; omitted means now.
+    ts = when or _now(prefs.timezone)
+    return {"ts": _iso(ts), "kind": kind, "note": note or "", "_ts": ts, "_epoch": ts.timestamp()}
+
+
+def _flush_entries(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Journal all entries built during one call with a single append; returns them as recorded.
+    if entries:
+        # A legacy journal must be migrated before the first append creates journal.jsonl; if
+        # that fails the report fails, as a failed save always has.
+        with _JOURNAL_LOCK:
+            _ensure_journal_migrated()
+        _enqueue_journal_write(entries)
+    return [{k: v for k, v in e.items() if not k.startswith("_")} for e in entries]
+
+
+def _last_of_many(journal: _JournalIndex, kinds: Iterable[str], now: datetime) -> Dict[str, datetime]:
+    # Most recently logged entry per kind at or before now; kinds never logged are omitted.
+    # The index answers directly unless a kind's newest entry is future-dated; those kinds
+    # share a single backwards scan.
+    found: Dict[str, datetime] = {}
+    missing: Set[str] = set()
+    for kind in kinds:
+        latest = journal.last_by_kind.get(kind)
+        if latest is None:
+            continue
+        if latest <= now:
+            found[kind] = latest
+        else:
+            missing.add(kind)
+    if missing:
+        now_epoch = now.timestamp()
+        for e in reversed(journal.entries):
+            kind = e["kind"]
+            if kind in missing and e["_epoch"] <= now_epoch:
+                found[kind] = e["_ts"]
+                missing.discard(kind)
+                if not missing:
+                    break
+    return found
 
 
-def _sleep_pred(day_entries: List[Dict[str, Any]]) -> bool:
-    return any(e.get("kind") in ("sleep_start", "sleep_end") for e in day_entries)
+_MOVE_KINDS = frozenset({"move"})
+_MEAL_KINDS = frozenset({"meal"})
+_SLEEP_KINDS = frozenset({"sleep_start", "sleep_end"})
 
 
-def _next_due(now: datetime, prefs: Preferences) -> Dict[str, Any]:
+@dataclass
+class _JournalAggregate:
+    last_by_kind: Dict[str, datetime]  # latest logged entry per kind at or before now
+    counts_today: Dict[str, int]
+    by_day: Dict[date, List[Dict[str, Any]]]
+
+
+def _aggregate_journal(now: datetime) -> _JournalAggregate:
+    # Everything the status bundle needs, read from the journal index instead of a full scan.
+    journal = _load_journal()
+    last_by_kind = _last_of_many(journal, journal.last_by_kind, now)
+
+    # Two binary searches per kind over its sorted epochs, whatever the journal's size.
+    start, end = (bound.timestamp() for bound in _today_bounds(now))
+    counts_today: Dict[str, int] = {}
+    for kind, epochs in journal.epochs_by_kind.items():
+        count = bisect.bisect_left(epochs, end) - bisect.bisect_left(epochs, start)
+        if count:
+            counts_today[kind] = count
+    return _JournalAggregate(last_by_kind=last_by_kind, counts_today=counts_today, by_day=journal.by_day)
+
+
+def _days_streak(by_day: Dict[date, List[Dict[str, Any]]], kinds: FrozenSet[str], today: date) -> int:
+    # Consecutive days, ending today, with at least one entry of the given kinds.
+    d = today
+    streak = 0
+    while any(e["kind"] in kinds for e in by_day.get(d, ())):
+        streak += 1
+        d -= timedelta(days=1)
+    return streak
+
+
+@dataclass
+class _PrefsDerived:
+    # Time-of-day values that several helpers need, derived once per request.
+    quiet: bool
+    ideal_dt: datetime  # today's ideal sleep start, in now's timezone
+
+
+def _derive_prefs(now: datetime, prefs: Preferences) -> _PrefsDerived:
+    ideal = prefs._ideal_sleep_time
+    ideal_dt = now.replace(hour=ideal.hour, minute=ideal.minute, second=0, microsecond=0)
+    return _PrefsDerived(quiet=_in_quiet_hours(now, prefs), ideal_dt=ideal_dt)
+
+
+def _next_due(now: datetime, prefs: Preferences, agg: _JournalAggregate, derived: _PrefsDerived) -> Dict[str, Any]:
     # Calculate next times due for nudges
     res: Dict[str, Any] = {}
 
-    last_move = _last_of("move", now)
+    last_move = agg.last_by_kind.get("move")
     move_due_at = (last_move or now) + timedelta(minutes=prefs.move_interval_min)
     res["move_due_at"] = _iso(move_due_at)
 
-    last_meal = _last_of("meal", now)
+    last_meal = agg.last_by_kind.get("meal")
     meal_due_at = (last_meal or now) + timedelta(hours=prefs.meal_interval_hours)
     res["meal_due_at"] = _iso(meal_due_at)
 
     # Sleep nudge window around ideal start
-    ideal = _hhmm_to_time(prefs.ideal_sleep_start)
-    ideal_dt = now.replace(hour=ideal.hour, minute=ideal.minute, second=0, microsecond=0)
+    ideal_dt = derived.ideal_dt
     if ideal_dt < now:
         ideal_dt = ideal_dt + timedelta(days=1)
     res["sleep_ideal_at"] = _iso(ideal_dt)
     return res
 
 
-def _nudge(now: datetime, prefs: Preferences) -> Dict[str, Any]:
-    quiet = _in_quiet_hours(now, prefs)
-    last_move = _last_of("move", now)
-    last_meal = _last_of("meal", now)
+_NO_NUDGE: Dict[str, Any] = {
+    "kind": "none",
+    "message": "All good — keep stacking small habits. Small daily choices shape long-term healthspan.",
+    "why": "no_nudge_needed_or_quiet_hours",
+}
+
+
+def _nudge(now: datetime, prefs: Preferences, agg: _JournalAggregate, derived: _PrefsDerived) -> Dict[str, Any]:
+    quiet = derived.quiet
+    if quiet and not prefs.sleep_escalate_ignore_quiet_hours:
+        # Nothing can be nudged during quiet hours unless sleep escalation overrides them.
+        return dict(_NO_NUDGE)
 
     move_overdue_min = None
     meal_overdue_min = None
 
-    if last_move is not None:
-        delta = now - last_move
-        move_overdue_min = int(delta.total_seconds() // 60) - prefs.move_interval_min
-    if last_meal is not None:
-        delta = now - last_meal
-        meal_overdue_min = int(delta.total_seconds() // 60) - prefs.meal_interval_hours * 60
+    if not quiet:
+        last_move = agg.last_by_kind.get("move")
+        last_meal = agg.last_by_kind.get("meal")
+        if last_move is not None:
+            delta = now - last_move
+            move_overdue_min = int(delta.total_seconds() // 60) - prefs.move_interval_min
+        if last_meal is not None:
+            delta = now - last_meal
+            meal_overdue_min = int(delta.total_seconds() // 60) - prefs.meal_interval_hours * 60
 
     # Sleep readiness / escalation nudges around and after ideal start
-    ideal = _hhmm_to_time(prefs.ideal_sleep_start)
-    ideal_dt = now.replace(hour=ideal.hour, minute=ideal.minute, second=0, microsecond=0)
+    ideal_dt = derived.ideal_dt
     # Window: 45 min before to 30 min after (gentle)
     sleep_nudge = None
     window_start = ideal_dt - timedelta(minutes=45)
@@ -370,16 +802,12 @@ def _nudge(now: datetime, prefs: Preferences) -> Dict[str, Any]:
     if sleep_nudge and (not quiet or prefs.sleep_escalate_ignore_quiet_hours):
         # Prioritize sleep strongly; after-ideal gains additional weight by minutes overdue
         weight = 10_000
-        if sleep_nudge.get("why") == "past_ideal_sleep_time":
-            weight += int(sleep_nudge.get("minutes_over", 0))
+        if sleep_nudge["why"] == "past_ideal_sleep_time":
+            weight += sleep_nudge["minutes_over"]
         candidates.append((weight, sleep_nudge))
 
     if not candidates:
-        return {
-            "kind": "none",
-            "message": "All good — keep stacking small habits. Small daily choices shape long-term healthspan.",
-            "why": "no_nudge_needed_or_quiet_hours",
-        }
+        return dict(_NO_NUDGE)
 
     # Pick the most overdue (highest score)
     candidates.sort(key=lambda x: x[0], reverse=True)
@@ -427,17 +855,21 @@ class HealthInput(BaseModel):
     )
 
 
-def _status_bundle(now: datetime, prefs: Preferences) -> Dict[str, Any]:
-    move_count = _count_today(["move"], now)
-    meal_count = _count_today(["meal"], now)
-    sleep_events = _count_today(["sleep_start", "sleep_end"], now)
-    streaks = {
-        "move_days": _days_streak(_move_pred),
-        "meal_days": _days_streak(_meals_pred),
-        "sleep_days": _days_streak(_sleep_pred),
-    }
-    due = _next_due(now, prefs)
-    nudge = _nudge(now, prefs)
+def _status_bundle(now: datetime, prefs: Preferences, agg: _JournalAggregate, derived: _PrefsDerived, include_streaks: bool = True) -> Dict[str, Any]:
+    counts = agg.counts_today
+    move_count = counts.get("move", 0)
+    meal_count = counts.get("meal", 0)
+    sleep_events = sum(counts.get(k, 0) for k in _SLEEP_KINDS)
+    streaks: Optional[Dict[str, int]] = None
+    if include_streaks:
+        today = now.date()
+        streaks = {
+            "move_days": _days_streak(agg.by_day, _MOVE_KINDS, today),
+            "meal_days": _days_streak(agg.by_day, _MEAL_KINDS, today),
+            "sleep_days": _days_streak(agg.by_day, _SLEEP_KINDS, today),
+        }
+    due = _next_due(now, prefs, agg, derived)
+    nudge = _nudge(now, prefs, agg, derived)
     return {
         "now": _iso(now),
         "counts_today": {"move": move_count, "meal": meal_count, "sleep_events": sleep_events},
@@ -465,12 +897,16 @@ def health_preflight(payload: HealthInput) -> Dict[str, Any]:
     - To update preferences: include set_prefs.
     - Returns: status, nudge, and optional ask items (questions) with how_to_answer hints.
     """
-    prefs = Preferences.load()
+    prefs = _load_prefs_prefetching_journal()
     # Preferences update first
     changed: Dict[str, Any] = {}
     if payload.set_prefs is not None:
         upd = payload.set_prefs
-        for k, v in upd.model_dump(exclude_none=True).items():
+        # Only fields the caller actually sent; skips dumping every unset field.
+        for k in upd.model_fields_set:
+            v = getattr(upd, k)
+            if v is None:
+                continue
             setattr(prefs, k, v)
             changed[k] = v
         if changed:
@@ -478,8 +914,14 @@ def health_preflight(payload: HealthInput) -> Dict[str, Any]:
 
     # Record any immediate reports. The client should provide exact ISO timestamps in *_when
     # if the user mentioned a relative time (e.g., "2 hours ago").
-    recorded: List[Dict[str, Any]] = []
+    pending: List[Dict[str, Any]] = []
     errors: List[Dict[str, Any]] = []
+    for message in _take_journal_write_errors():
+        errors.append({
+            "field": "journal",
+            "code": "journal_write_failed",
+            "message": f"Earlier entries could not be saved to disk ({message}). They are kept in memory and retried with the next report, but will be lost if the server stops first.",
+        })
     # Consistency checks: don't send notes/timestamps when not reporting the event
     if (payload.move_note or payload.move_when) and not payload.report_move:
         errors.append({
@@ -500,7 +942,8 @@ def health_preflight(payload: HealthInput) -> Dict[str, Any]:
             "message": "Do not send sleep_note/sleep_when unless report_sleep is provided.",
         })
     if payload.report_move:
-        if payload.move_when and _parse_iso_or_none(payload.move_when) is None:
+        move_when = _parse_iso_or_none(payload.move_when)
+        if payload.move_when and move_when is None:
             errors.append({
                 "field": "move_when",
                 "code": "invalid_timestamp",
@@ -508,9 +951,10 @@ def health_preflight(payload: HealthInput) -> Dict[str, Any]:
                 "provided": payload.move_when,
             })
         else:
-            recorded.append(_add_entry("move", payload.move_note or "", prefs, payload.move_when))
+            pending.append(_build_entry("move", payload.move_note or "", prefs, move_when))
     if payload.report_meal:
-        if payload.meal_when and _parse_iso_or_none(payload.meal_when) is None:
+        meal_when = _parse_iso_or_none(payload.meal_when)
+        if payload.meal_when and meal_when is None:
             errors.append({
                 "field": "meal_when",
                 "code": "invalid_timestamp",
@@ -518,10 +962,11 @@ def health_preflight(payload: HealthInput) -> Dict[str, Any]:
                 "provided": payload.meal_when,
             })
         else:
-            recorded.append(_add_entry("meal", payload.meal_note or "", prefs, payload.meal_when))
+            pending.append(_build_entry("meal", payload.meal_note or "", prefs, meal_when))
     if payload.report_sleep:
         kind = "sleep_start" if payload.report_sleep == "start" else "sleep_end"
-        if payload.sleep_when and _parse_iso_or_none(payload.sleep_when) is None:
+        sleep_when = _parse_iso_or_none(payload.sleep_when)
+        if payload.sleep_when and sleep_when is None:
             errors.append({
                 "field": "sleep_when",
                 "code": "invalid_timestamp",
@@ -529,17 +974,24 @@ def health_preflight(payload: HealthInput) -> Dict[str, Any]:
                 "provided": payload.sleep_when,
             })
         else:
-            recorded.append(_add_entry(kind, payload.sleep_note or "", prefs, payload.sleep_when))
+            pending.append(_build_entry(kind, payload.sleep_note or "", prefs, sleep_when))
+    recorded = _flush_entries(pending)
 
     now = _now(prefs.timezone)
-    quiet = _in_quiet_hours(now, prefs)
-    status = _status_bundle(now, prefs)
+    derived = _derive_prefs(now, prefs)
+    quiet = derived.quiet
+    # Quiet hours with no sleep escalation allowed produce no nudge or asks; for this common
+    # night-time call with nothing reported, skip the streak computation.
+    reported = bool(payload.report_move or payload.report_meal or payload.report_sleep)
+    idle_quiet = quiet and not prefs.sleep_escalate_ignore_quiet_hours and not reported
+    agg = _aggregate_journal(now)
+    status = _status_bundle(now, prefs, agg, derived, include_streaks=not idle_quiet)
 
     # Build questions to ask; for sleep escalation we may ignore quiet hours
     asks: List[Dict[str, Any]] = []
     if not quiet:
-        last_move = _last_of("move", now)
-        last_meal = _last_of("meal", now)
+        last_move = agg.last_by_kind.get("move")
+        last_meal = agg.last_by_kind.get("meal")
         if last_move is None or now - last_move >= timedelta(minutes=prefs.move_interval_min):
             question = "Moved in the past hour, or are we calling chair‑yoga exercise? Even short breaks cut long‑term risk. What did you do?"
             asks.append(
@@ -676,7 +1128,10 @@ def update_preferences(payload: PreferencesUpdate) -> Dict[str, Any]:
     """
     prefs = Preferences.load()
     changed: Dict[str, Any] = {}
-    for k, v in payload.model_dump(exclude_none=True).items():
+    for k in payload.model_fields_set:
+        v = getattr(payload, k)
+        if v is None:
+            continue
         setattr(prefs, k, v)
         changed[k] = v
     if changed: